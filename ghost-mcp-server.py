@@ -1,9 +1,15 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 import httpx
-import json
+import orjson
 import time
-import jwt
+import base64
+import hashlib
+import hmac
 import os
+import atexit
+import asyncio
+import random
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
@@ -15,6 +21,8 @@ HOST = os.environ.get("HOST", "0.0.0.0")
 PORT = int(os.environ.get("PORT", 8053))
 GHOST_ADMIN_API_KEY = os.environ.get("GHOST_ADMIN_API_KEY")
 GHOST_BASE_URL = os.environ.get("GHOST_BASE_URL")
+GHOST_MAX_CONCURRENCY = int(os.environ.get("GHOST_MAX_CONCURRENCY", 8))
+GHOST_RATE_LIMIT = float(os.environ.get("GHOST_RATE_LIMIT", 100))  # requests per minute
 
 # Initialize FastMCP server
 mcp = FastMCP(
@@ -26,75 +34,217 @@ mcp = FastMCP(
 # Ghost API Configuration
 # The base URL should not include the API path
 GHOST_API_VERSION = "v4"
+_BASE_ADMIN_URL = f"{GHOST_BASE_URL}/ghost/api/{GHOST_API_VERSION}/admin/"
 
-async def make_ghost_request(endpoint: str, method: str = "GET", data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Make a request to the Ghost Admin API with proper error handling."""
-    # Construct the full URL with the API version
-    url = f"{GHOST_BASE_URL}/ghost/api/{GHOST_API_VERSION}/admin/{endpoint}"
-    
-    # Parse the API key into ID and SECRET parts
-    key_parts = GHOST_ADMIN_API_KEY.split(':')
-    if len(key_parts) != 2:
-        return {"error": "Invalid API key format. Expected 'ID:SECRET'"}
-    
-    id_part, secret_part = key_parts
-    
-    # Generate JWT token for Ghost Admin API authentication
-    iat = int(time.time())
-    exp = iat + 300  # 5 minutes expiration
+# Parse the API key into ID and SECRET parts once at startup
+_key_parts = (GHOST_ADMIN_API_KEY or "").split(':')
+if len(_key_parts) != 2:
+    raise RuntimeError("Invalid GHOST_ADMIN_API_KEY format. Expected 'ID:SECRET'")
+_KID = _key_parts[0]
+try:
+    _SECRET = bytes.fromhex(_key_parts[1])
+except ValueError:
+    raise RuntimeError("Invalid GHOST_ADMIN_API_KEY format. Expected 'ID:SECRET' with a hex SECRET") from None
+
+# Static parts of the Admin API token
+_AUD = f"/{GHOST_API_VERSION}/admin/"
+
+def _b64url(data: bytes) -> str:
+    """Base64url-encode bytes without padding, as required by JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+_JWT_HEADER_B64 = _b64url(orjson.dumps({
+    "alg": "HS256",
+    "typ": "JWT",
+    "kid": _KID
+}))
+
+# Headers sent on every Admin API request; only Authorization varies per call
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Version": GHOST_API_VERSION
+}
+
+# Shared HTTP client so connections to the Ghost host are pooled across tool calls
+_client: Optional[httpx.AsyncClient] = None
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it inside the running event loop on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        # HTTP/2 multiplexes concurrent tool calls over one connection; retries are
+        # left to make_ghost_request's backoff rather than the transport
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30)
+        )
+        _client = httpx.AsyncClient(
+            base_url=GHOST_BASE_URL or "",
+            timeout=30.0,
+            transport=transport,
+            headers=_BASE_HEADERS
+        )
+    return _client
+
+@atexit.register
+def _close_client() -> None:
+    """Close the shared AsyncClient when the server exits."""
+    if _client is not None and not _client.is_closed:
+        try:
+            asyncio.run(_client.aclose())
+        except Exception:
+            pass
+
+# Cached Admin API token as (token, exp); reused until it is close to expiry
+_jwt_cache: Optional[Tuple[str, int]] = None
+JWT_TTL = 300  # 5 minutes expiration
+JWT_RENEW_MARGIN = 30  # refresh this many seconds before the token expires
+
+def _get_jwt() -> str:
+    """Return a JWT for the Ghost Admin API, reusing the cached token while it is still valid."""
+    global _jwt_cache
+    now = int(time.time())
+    if _jwt_cache and _jwt_cache[1] - now > JWT_RENEW_MARGIN:
+        return _jwt_cache[0]
     
+    exp = now + JWT_TTL
+    _jwt_cache = (_sign_jwt(now, exp), exp)
+    return _jwt_cache[0]
+
+def _sign_jwt(iat: int, exp: int) -> str:
+    """Sign an HS256 JWT for the Ghost Admin API; only the payload varies between tokens."""
     payload = {
         "iat": iat,
         "exp": exp,
-        "aud": f"/{GHOST_API_VERSION}/admin/"
+        "aud": _AUD
     }
+    signing_input = f"{_JWT_HEADER_B64}.{_b64url(orjson.dumps(payload))}"
+    signature = hmac.new(_SECRET, signing_input.encode("ascii"), hashlib.sha256).digest()
+    return f"{signing_input}.{_b64url(signature)}"
+
+# HTTP methods accepted by make_ghost_request, and those that carry a JSON body
+_ALLOWED_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Retry policy for rate limited (429) and transient upstream (5xx) responses
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+def _should_retry(method: str, response: httpx.Response) -> bool:
+    """Decide whether a response is worth retrying for the given HTTP method."""
+    status_code = response.status_code
+    if status_code not in RETRY_STATUS_CODES:
+        return False
+    # POST is not idempotent: a 502/504 may arrive after Ghost already created the
+    # post, so only retry when Ghost signals it did not process the request
+    if method == "POST":
+        return status_code == 429 or (status_code == 503 and "retry-after" in response.headers)
+    return True
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Compute the backoff delay, honoring Retry-After when Ghost sends one."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+    return delay * (1 + random.random() * RETRY_JITTER)
+
+# Client-side admission control so bursts of tool calls stay under Ghost's rate limit
+_rate_limit_sem = asyncio.Semaphore(GHOST_MAX_CONCURRENCY)
+_base_rate = GHOST_RATE_LIMIT / 60.0  # tokens per second
+_bucket_capacity = max(1.0, float(GHOST_MAX_CONCURRENCY))
+
+@dataclass
+class BucketState:
+    """Token bucket for one Ghost host, slowed down while that host answers with 429s."""
+    tokens: float = _bucket_capacity
+    last_refill: float = field(default_factory=time.monotonic)
+    failure_ema: float = 0.0  # moving average of the 429 rate
+
+    @property
+    def rate(self) -> float:
+        """Refill rate scaled down by recent 429 feedback, never below 10% of the base rate."""
+        return _base_rate * (1 - min(0.9, 4 * self.failure_ema))
+
+# Buckets are keyed by host so one throttled Ghost instance does not slow down another
+_buckets: Dict[str, BucketState] = {}
+_GHOST_HOST = httpx.URL(_BASE_ADMIN_URL).host
+
+async def _acquire_rate_token(host: str) -> None:
+    """Wait until the host's token bucket allows another request to Ghost."""
+    bucket = _buckets.setdefault(host, BucketState())
+    while True:
+        now = time.monotonic()
+        rate = bucket.rate
+        bucket.tokens = min(_bucket_capacity, bucket.tokens + (now - bucket.last_refill) * rate)
+        bucket.last_refill = now
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return
+        await asyncio.sleep((1 - bucket.tokens) / rate)
+
+def _record_response(host: str, status_code: int) -> None:
+    """Feed a response status into the host's 429 moving average."""
+    bucket = _buckets.setdefault(host, BucketState())
+    bucket.failure_ema = 0.9 * bucket.failure_ema + 0.1 * (1.0 if status_code == 429 else 0.0)
+
+async def make_ghost_request(endpoint: str, method: str = "GET", data: Optional[Dict[str, Any]] = None,
+                             params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Make a request to the Ghost Admin API with proper error handling."""
+    # Construct the full URL with the API version
+    url = _BASE_ADMIN_URL + endpoint
     
-    jwt_headers = {
-        "alg": "HS256",
-        "typ": "JWT",
-        "kid": id_part
-    }
+    method = method.upper()
+    if method not in _ALLOWED_METHODS:
+        return {"error": f"Unsupported method: {method}"}
     
+    client = await get_client()
     try:
-        token = jwt.encode(
-            payload,
-            bytes.fromhex(secret_part),
-            algorithm="HS256",
-            headers=jwt_headers
-        )
-    except Exception as e:
-        return {"error": f"Failed to generate JWT token: {str(e)}"}
-    
-    # Set headers with JWT token
-    headers = {
-        "Authorization": f"Ghost {token}",
-        "Content-Type": "application/json",
-        "Accept-Version": GHOST_API_VERSION
-    }
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            if method.upper() == "GET":
-                response = await client.get(url, headers=headers, timeout=30.0)
-            elif method.upper() == "POST":
-                response = await client.post(url, headers=headers, json=data, timeout=30.0)
-            elif method.upper() == "PUT":
-                response = await client.put(url, headers=headers, json=data, timeout=30.0)
-            else:
-                return {"error": f"Unsupported method: {method}"}
-                
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                token = _get_jwt()
+            except Exception as e:
+                return {"error": f"Failed to generate JWT token: {str(e)}"}
+            
+            # Set headers with JWT token
+            headers = {"Authorization": f"Ghost {token}"}
+            kwargs = {"headers": headers, "timeout": 30.0}
+            if params:
+                kwargs["params"] = params
+            if data is not None and method in _BODY_METHODS:
+                kwargs["content"] = orjson.dumps(data)
+            
+            async with _rate_limit_sem:
+                await _acquire_rate_token(_GHOST_HOST)
+                response = await client.request(method, url, **kwargs)
+            _record_response(_GHOST_HOST, response.status_code)
+            
+            if attempt < MAX_RETRIES and _should_retry(method, response):
+                await asyncio.sleep(_retry_delay(response, attempt))
+                continue
+            break
+            
+        if response.status_code >= 400:
             return {
-                "error": f"{e}",
-                "status_code": e.response.status_code,
-                "url": str(e.request.url),
-                "headers": dict(e.request.headers),
-                "response_text": e.response.text
+                "error": f"HTTP {response.status_code}: {response.text or response.reason_phrase}",
+                "status_code": response.status_code,
+                "url": str(response.request.url)
             }
-        except Exception as e:
-            return {"error": str(e)}
+        # Parse the raw bytes directly; no intermediate str decode of the body.
+        # DELETE and similar calls answer 204 with no body at all.
+        body = response.content
+        return orjson.loads(body) if body else {}
+    except httpx.RequestError as e:
+        return {"error": str(e), "url": url}
+    except Exception as e:
+        return {"error": str(e)}
 
 import re
 
@@ -109,16 +259,12 @@ def truncate_text(text: str, length: int) -> str:
         return text
     return text[:length].rsplit(' ', 1)[0] + '...'
 
-@mcp.tool()
-async def create_post(title: str, content: str, status: str = "draft", tags: Optional[List[str]] = None) -> str:
-    """Create a new post in Ghost.
-    
-    Args:
-        title: The title of the post
-        content: The content/body of the post in HTML format
-        status: Post status (draft, published, scheduled)
-        tags: Optional list of tags to associate with the post
-    """
+def _to_tag_list(tags: List[str]) -> List[Dict[str, str]]:
+    """Convert tag names into the tag objects the Ghost Admin API expects."""
+    return [{"name": tag} for tag in tags]
+
+async def _create_post(title: str, content: str, status: str = "draft", tags: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Create a post and return a summary of it, or a dict with an "error" message."""
     # Generate SEO fields
     plain_text = strip_html_tags(content)
     meta_title = title
@@ -145,101 +291,96 @@ async def create_post(title: str, content: str, status: str = "draft", tags: Opt
     
     # Add tags if provided
     if tags:
-        post_data["posts"][0]["tags"] = [{
-            "name": tag
-        } for tag in tags]
+        post_data["posts"][0]["tags"] = _to_tag_list(tags)
     
     # Make the API request
     # Add source=html query parameter to ensure proper HTML content handling
     response = await make_ghost_request("posts/?source=html", method="POST", data=post_data)
     
     if "error" in response:
-        return f"Error creating post: {response['error']}"
+        return {"error": f"Error creating post: {response['error']}"}
     
     # Extract relevant information from the response
     try:
         post = response["posts"][0]
-        return json.dumps({
+        return {
             "id": post["id"],
             "title": post["title"],
             "url": post["url"],
             "status": post["status"],
             "created_at": post["created_at"]
-        }, indent=2)
+        }
     except (KeyError, IndexError):
-        return f"Unexpected response format: {json.dumps(response)}"
+        return {"error": f"Unexpected response format: {orjson.dumps(response).decode()}"}
+
+@mcp.tool()
+async def create_post(title: str, content: str, status: str = "draft", tags: Optional[List[str]] = None) -> str:
+    """Create a new post in Ghost.
+    
+    Args:
+        title: The title of the post
+        content: The content/body of the post in HTML format
+        status: Post status (draft, published, scheduled)
+        tags: Optional list of tags to associate with the post
+    """
+    result = await _create_post(title, content, status, tags)
+    if "error" in result:
+        return result["error"]
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+# Number of response bytes debug_api_connection reports back
+DEBUG_PREVIEW_BYTES = 500
 
 @mcp.tool()
 async def debug_api_connection() -> str:
     """Debug the Ghost API connection to help diagnose issues."""
+    # The API key was validated at startup; generate the token before any network
+    # work so a signing failure is reported without probing the site first
+    try:
+        token = _get_jwt()
+    except Exception as e:
+        return orjson.dumps({
+            "error": f"Failed to generate JWT token: {str(e)}",
+            "api_key_id": _KID
+        }, option=orjson.OPT_INDENT_2).decode()
+    
+    # Set headers with JWT token
+    headers = {"Authorization": f"Ghost {token}"}
+    
     # Try a simple request to the API root
-    async with httpx.AsyncClient() as client:
-        try:
-            # Test the site URL first
-            site_response = await client.get(f"{GHOST_BASE_URL}/ghost/", timeout=30.0)
-            
-            # Extract ID and SECRET from the API key for debugging
-            key_parts = GHOST_ADMIN_API_KEY.split(':')
-            if len(key_parts) != 2:
-                return {"error": "Invalid API key format. Expected 'ID:SECRET'"}
-            
-            id_part, secret_part = key_parts
-            
-            # Generate JWT token for Ghost Admin API authentication
-            iat = int(time.time())
-            exp = iat + 300  # 5 minutes expiration
-            
-            payload = {
-                "iat": iat,
-                "exp": exp,
-                "aud": f"/{GHOST_API_VERSION}/admin/"
-            }
-            
-            jwt_headers = {
-                "alg": "HS256",
-                "typ": "JWT",
-                "kid": id_part
-            }
-            
-            try:
-                token = jwt.encode(
-                    payload,
-                    bytes.fromhex(secret_part),
-                    algorithm="HS256",
-                    headers=jwt_headers
-                )
-            except Exception as e:
-                return json.dumps({"error": f"Failed to generate JWT token: {str(e)}"}, indent=2)
-            
-            # Set headers with JWT token
-            headers = {
-                "Authorization": f"Ghost {token}",
-                "Content-Type": "application/json",
-                "Accept-Version": GHOST_API_VERSION
-            }
-            
-            # Try the site endpoint which should be more accessible
-            api_url = f"{GHOST_BASE_URL}/ghost/api/{GHOST_API_VERSION}/admin/site/"
-            api_response = await client.get(
-                api_url, 
-                headers=headers, 
-                timeout=30.0
-            )
-            
-            return json.dumps({
-                "site_status": site_response.status_code,
-                "site_url": str(site_response.url),
-                "api_status": api_response.status_code,
-                "api_url": str(api_response.url),
-                "api_response": api_response.text[:500] if len(api_response.text) > 500 else api_response.text,
-                "headers_sent": dict(headers)
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": str(e),
-                "api_url": GHOST_ADMIN_API_URL,
-                "api_key_format": "ID:SECRET" if len(key_parts) == 2 else "Invalid"
-            }, indent=2)
+    client = await get_client()
+    api_url = _BASE_ADMIN_URL + "site/"
+    try:
+        # Test the site URL first
+        site_response = await client.get(f"{GHOST_BASE_URL}/ghost/", timeout=30.0)
+        
+        # Try the site endpoint which should be more accessible
+        # Only read the start of the body; the full site payload is not needed here
+        async with client.stream("GET", api_url, headers=headers, timeout=30.0) as api_response:
+            preview = b""
+            async for chunk in api_response.aiter_bytes():
+                preview += chunk
+                if len(preview) >= DEBUG_PREVIEW_BYTES:
+                    break
+        
+        return orjson.dumps({
+            "site_status": site_response.status_code,
+            "site_url": str(site_response.url),
+            "api_status": api_response.status_code,
+            "api_url": str(api_response.url),
+            "api_key_id": _KID,
+            "api_response": preview[:DEBUG_PREVIEW_BYTES].decode(api_response.encoding or "utf-8", errors="replace"),
+            "headers_sent": {**_BASE_HEADERS, "Authorization": "Ghost <redacted>"}
+        }, option=orjson.OPT_INDENT_2).decode()
+    except Exception as e:
+        return orjson.dumps({
+            "error": str(e),
+            "api_url": api_url,
+            "api_key_id": _KID
+        }, option=orjson.OPT_INDENT_2).decode()
+
+# Post fields list_posts reports; fetching only these skips the HTML bodies
+LIST_POSTS_FIELDS = "id,title,status,created_at,updated_at"
 
 @mcp.tool()
 async def list_posts(limit: int = 10, status: str = "all") -> str:
@@ -249,13 +390,13 @@ async def list_posts(limit: int = 10, status: str = "all") -> str:
         limit: Maximum number of posts to retrieve (default: 10)
         status: Filter by post status (all, draft, published, scheduled)
     """
-    # Prepare query parameters
-    endpoint = f"posts/?source=html&limit={limit}"
+    # Prepare query parameters, requesting only the fields returned to the caller
+    params = {"limit": limit, "fields": LIST_POSTS_FIELDS}
     if status != "all":
-        endpoint += f"&filter=status:{status}"
+        params["filter"] = f"status:{status}"
     
     # Make the API request
-    response = await make_ghost_request(endpoint)
+    response = await make_ghost_request("posts/", params=params)
     
     if "error" in response:
         return f"Error listing posts: {response['error']}"
@@ -276,84 +417,172 @@ async def list_posts(limit: int = 10, status: str = "all") -> str:
                 "updated_at": post["updated_at"]
             })
         
-        return json.dumps(result, indent=2)
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
     except (KeyError, IndexError):
-        return f"Unexpected response format: {json.dumps(response)}"
+        return f"Unexpected response format: {orjson.dumps(response).decode()}"
 
-@mcp.tool()
-async def edit_post(post_id: str, title: Optional[str] = None, content: Optional[str] = None, 
-                 status: Optional[str] = None, tags: Optional[List[str]] = None) -> str:
-    """Edit an existing post in Ghost.
-    
-    Args:
-        post_id: The ID of the post to edit
-        title: New title for the post (optional)
-        content: New content/body for the post in HTML format (optional)
-        status: New post status (draft, published, scheduled) (optional)
-        tags: New list of tags to associate with the post (optional)
-    """
-    # First, get the current post data
-    current_post = await make_ghost_request(f"posts/{post_id}/?source=html")
+async def _edit_post(post_id: str, title: Optional[str] = None, content: Optional[str] = None, 
+                     status: Optional[str] = None, tags: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Edit a post and return a summary of it, or a dict with an "error" message."""
+    # First, get the current post data, fetching only the fields this edit depends on.
+    # updated_at is always required by Ghost for version control; the current title
+    # and html are only needed to regenerate SEO fields when one of them changes.
+    fields = ["id", "updated_at"]
+    seo_changed = title is not None or content is not None
+    if seo_changed:
+        if title is None:
+            fields.append("title")
+        if content is None:
+            fields.append("html")
+    params = {"fields": ",".join(fields)}
+    if "html" in fields:
+        params["formats"] = "html"
+    current_post = await make_ghost_request(f"posts/{post_id}/", params=params)
     
     if "error" in current_post:
-        return f"Error retrieving post: {current_post['error']}"
+        return {"error": f"Error retrieving post: {current_post['error']}"}
     
     try:
         # Extract the current post data
         post = current_post["posts"][0]
         
-        # Prepare the updated post data
-        # Generate SEO fields
-        updated_title = title if title is not None else post["title"]
-        updated_content = content if content is not None else post["html"]
-        plain_text = strip_html_tags(updated_content)
-        meta_title = updated_title
-        meta_description = truncate_text(plain_text, 150)
-        og_title = updated_title
-        og_description = meta_description
-        twitter_title = updated_title
-        twitter_description = meta_description
-
-        post_data = {
-            "posts": [{
-                "id": post_id,
-                "title": updated_title,
-                "html": updated_content,
-                "status": status if status is not None else post["status"],
-                "updated_at": post["updated_at"],  # Required for version control
+        # Prepare the updated post data with only the changed keys
+        updated_post_data = {
+            "id": post_id,
+            "updated_at": post["updated_at"]  # Required for version control
+        }
+        if status is not None:
+            updated_post_data["status"] = status
+        
+        if seo_changed:
+            # Generate SEO fields
+            updated_title = title if title is not None else post["title"]
+            updated_content = content if content is not None else (post.get("html") or "")
+            plain_text = strip_html_tags(updated_content)
+            meta_title = updated_title
+            meta_description = truncate_text(plain_text, 150)
+            og_title = updated_title
+            og_description = meta_description
+            twitter_title = updated_title
+            twitter_description = meta_description
+            
+            if title is not None:
+                updated_post_data["title"] = title
+            if content is not None:
+                updated_post_data["html"] = content
+            updated_post_data.update({
                 "meta_title": meta_title,
                 "meta_description": meta_description,
                 "og_title": og_title,
                 "og_description": og_description,
                 "twitter_title": twitter_title,
                 "twitter_description": twitter_description
-            }]
-        }
+            })
+        
+        post_data = {"posts": [updated_post_data]}
         
         # Add tags if provided
         if tags:
-            post_data["posts"][0]["tags"] = [{
-                "name": tag
-            } for tag in tags]
+            post_data["posts"][0]["tags"] = _to_tag_list(tags)
         
         # Make the API request to update the post
         # Add source=html query parameter to ensure proper HTML content handling
         response = await make_ghost_request(f"posts/{post_id}/?source=html", method="PUT", data=post_data)
         
         if "error" in response:
-            return f"Error updating post: {response['error']}"
+            return {"error": f"Error updating post: {response['error']}"}
         
         # Extract relevant information from the response
         updated_post = response["posts"][0]
-        return json.dumps({
+        return {
             "id": updated_post["id"],
             "title": updated_post["title"],
             "url": updated_post["url"],
             "status": updated_post["status"],
             "updated_at": updated_post["updated_at"]
-        }, indent=2)
+        }
     except (KeyError, IndexError) as e:
-        return f"Error processing post data: {str(e)}"
+        return {"error": f"Error processing post data: {str(e)}"}
+
+@mcp.tool()
+async def edit_post(post_id: str, title: Optional[str] = None, content: Optional[str] = None, 
+                 status: Optional[str] = None, tags: Optional[List[str]] = None) -> str:
+    """Edit an existing post in Ghost.
+    
+    Args:
+        post_id: The ID of the post to edit
+        title: New title for the post (optional)
+        content: New content/body for the post in HTML format (optional)
+        status: New post status (draft, published, scheduled) (optional)
+        tags: New list of tags to associate with the post (optional)
+    """
+    result = await _edit_post(post_id, title, content, status, tags)
+    if "error" in result:
+        return result["error"]
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+async def _gather_batch(results: List[Optional[Dict[str, Any]]],
+                        pending: Dict[int, Awaitable[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Run the pending post operations concurrently and fill their slots in results.
+    
+    Concurrency is already capped by make_ghost_request's limiter, so the calls are
+    gathered directly.
+    """
+    outcomes = await asyncio.gather(*pending.values(), return_exceptions=True)
+    for index, outcome in zip(pending, outcomes):
+        results[index] = {"error": str(outcome)} if isinstance(outcome, BaseException) else outcome
+    return results
+
+def _batch_summary(result: Dict[str, Any], post_id: Optional[str] = None) -> Dict[str, Any]:
+    """Reduce a single post result to the id/url/status/error shape used by batch tools."""
+    if "error" in result:
+        return {"id": post_id, "error": result["error"]}
+    return {"id": result["id"], "url": result["url"], "status": result["status"]}
+
+@mcp.tool()
+async def create_posts(posts: List[Dict[str, Any]]) -> str:
+    """Create several posts in Ghost concurrently.
+    
+    Args:
+        posts: List of posts, each with "title", "content" and optional "status" (default draft) and "tags"
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(posts)
+    pending = {}
+    for i, post in enumerate(posts):
+        if "title" not in post or "content" not in post:
+            results[i] = {"error": "Each post requires 'title' and 'content'"}
+            continue
+        pending[i] = _create_post(post["title"], post["content"], post.get("status", "draft"), post.get("tags"))
+    
+    results = await _gather_batch(results, pending)
+    return orjson.dumps([_batch_summary(r) for r in results], option=orjson.OPT_INDENT_2).decode()
+
+@mcp.tool()
+async def edit_posts(updates: List[Dict[str, Any]]) -> str:
+    """Edit several existing posts in Ghost concurrently.
+    
+    Args:
+        updates: List of edits, each with "post_id" and optional "title", "content", "status" and "tags"
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+    pending = {}
+    for i, update in enumerate(updates):
+        if "post_id" not in update:
+            results[i] = {"error": "Each update requires 'post_id'"}
+            continue
+        pending[i] = _edit_post(
+            update["post_id"],
+            update.get("title"),
+            update.get("content"),
+            update.get("status"),
+            update.get("tags")
+        )
+    
+    results = await _gather_batch(results, pending)
+    return orjson.dumps(
+        [_batch_summary(r, u.get("post_id")) for r, u in zip(results, updates)],
+        option=orjson.OPT_INDENT_2
+    ).decode()
 
 if __name__ == "__main__":
     import sys